@@ -48,6 +48,7 @@ from .constants import (
     AP_TRANSIENT_SERVICE_KEY,
     AP_WAIT_FOR_EXIT_KEY,
     AP_WAIT_FOR_EXIT_POLL_SECONDS_KEY,
+    APPIMAGE_MOUNT_PREFIX,
     APPLICATIONS_DIR,
     ARCHIPELAGO_WORLDS_DIR,
     BIZHELPER_APPIMAGE_KEY,
@@ -63,6 +64,7 @@ from .constants import (
     MIME_PACKAGES_DIR,
     PENDING_RELAUNCH_ARGS_KEY,
     SAVE_MIGRATION_HELPER_PATH_KEY,
+    SFC_EXTENSION,
     STEAM_APPID_KEY,
     STEAM_ROOT_PATH_KEY,
     USE_CACHED_RELAUNCH_ARGS_KEY,
@@ -776,10 +778,18 @@ def _is_appimage_mounted(appimage: Optional[Path]) -> bool:
     except Exception:
         pass
 
+    stem = appimage.stem.lower()
     try:
-        for candidate in Path("/tmp").glob(".mount_*"):
-            if candidate.is_dir() and appimage.stem.lower() in candidate.name.lower():
-                return True
+        with os.scandir("/tmp") as entries:
+            for entry in entries:
+                # Name checks first; the directory test only runs for a matching mount.
+                if not entry.name.startswith(APPIMAGE_MOUNT_PREFIX) or stem not in entry.name.lower():
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        return True
+                except OSError:
+                    continue
     except Exception:
         pass
 
@@ -840,7 +850,7 @@ def _wait_for_archipelago_exit(
 
 
 def _find_matching_rom(patch: Path) -> Optional[Path]:
-    if patch.suffix.lower() == ".sfc" and patch.is_file():
+    if patch.suffix.lower() == SFC_EXTENSION and patch.is_file():
         return patch
 
     base = patch.with_suffix("")
@@ -848,16 +858,22 @@ def _find_matching_rom(patch: Path) -> Optional[Path]:
     if base != patch and base.is_file():
         return base
 
-    pattern = f"{base.name}.*"
-    candidates = []
-    for cand in patch.parent.glob(pattern):
-        if cand == patch or cand == base:
-            continue
-        if cand.is_file():
-            candidates.append(cand)
-
-    candidates.sort()
-    return candidates[0] if candidates else None
+    # One directory pass with a plain prefix test: no intermediate Paths for every sibling,
+    # and ROM names containing glob characters such as "[USA]" still match.
+    prefix = f"{base.name}."
+    skip = {patch.name, base.name}
+    best: Optional[str] = None
+    try:
+        with os.scandir(patch.parent) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith(prefix) or name in skip:
+                    continue
+                if (best is None or name < best) and entry.is_file():
+                    best = name
+    except OSError:
+        return None
+    return patch.parent / best if best else None
 
 
 def _wait_for_rom(patch: Path) -> Optional[Path]:
@@ -27,13 +27,12 @@ Commands:
 
 from __future__ import annotations
 
-import copy
 import json
 import os
 import shlex
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from .constants import (
     AP_APPIMAGE_KEY,
@@ -131,6 +130,9 @@ ENCODING_UTF8 = "utf-8"
 EXTENSIONS_KEY = "extensions"
 MODE_KEY = "mode"
 PROMPT_MODE = "prompt"
+_IMMUTABLE_DEFAULT_TYPES = (str, int, float, bool, tuple, frozenset, type(None))
+_SHALLOW_COPY_DEFAULT_TYPES = (list, dict, set)
+_JSON_CACHE: Dict[Path, Tuple[Tuple[int, int], bytes]] = {}
 # Keys we expose back to Bash as shell variables.
 INSTALL_STATE_KEYS = {
     AP_APPIMAGE_KEY,
@@ -262,8 +264,8 @@ def save_settings(settings: Dict[str, Any]) -> None:
     # are also removed from disk.
     _save_json(SETTINGS_FILE, general_settings)
     _save_json(PATH_SETTINGS_FILE, path_settings)
-    _save_json(INSTALL_STATE_FILE, install_state)
-    _save_json(STATE_SETTINGS_FILE, state_settings)
+    _save_json(INSTALL_STATE_FILE, install_state, sort_keys=False)
+    _save_json(STATE_SETTINGS_FILE, state_settings, sort_keys=False)
 
 
 def get_path_setting(settings: Dict[str, Any], key: str) -> Path:
@@ -281,7 +283,7 @@ def get_default_path_setting(key: str) -> Path:
 def save_apworld_cache(cache: Dict[str, Any]) -> None:
     """Persist the APWorld cache mapping."""
 
-    _save_json(APWORLD_CACHE_FILE, cache)
+    _save_json(APWORLD_CACHE_FILE, cache, sort_keys=False)
 
 
 def get_ext_behavior(ext: str) -> Optional[str]:
@@ -397,32 +399,75 @@ def _ensure_config_dir() -> None:
 
 
 def _load_json(path: Path) -> Dict[str, Any]:
-    if not path.exists():
+    # Raw file bytes are cached by (mtime, size) so an unchanged file skips the read; every call
+    # re-parses, which hands callers a fresh dict and is cheaper than copying a cached one.
+    try:
+        st = path.stat()
+    except OSError:
         return {}
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _JSON_CACHE.get(path)
     try:
-        with path.open("r", encoding=ENCODING_UTF8) as f:
-            return json.load(f)
+        if cached is not None and cached[0] == key:
+            raw = cached[1]
+        else:
+            raw = path.read_bytes()
+        data = json.loads(raw)
     except Exception:
         # Corrupt file? Treat as empty; the Bash side will behave as if
         # this is a first run and can repopulate values.
         return {}
+    _JSON_CACHE[path] = (key, raw)
+    return data
+
 
+def _save_json(path: Path, data: Dict[str, Any], *, sort_keys: bool = True) -> None:
+    """Atomically write ``data`` to ``path``.
 
-def _save_json(path: Path, data: Dict[str, Any]) -> None:
+    ``sort_keys`` keeps user-editable files stable; internal state files skip it. The write is
+    skipped when the file still holds exactly this payload as last read or written.
+    """
+    payload = (json.dumps(data, indent=2, sort_keys=sort_keys) + "\n").encode(ENCODING_UTF8)
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[1] == payload:
+        try:
+            st = path.stat()
+        except OSError:
+            pass
+        else:
+            if cached[0] == (st.st_mtime_ns, st.st_size):
+                return
     _ensure_config_dir()
     tmp = path.with_suffix(path.suffix + ".tmp")
-    with tmp.open("w", encoding=ENCODING_UTF8) as f:
-        json.dump(data, f, indent=2, sort_keys=True)
-        f.write("\n")
+    # One write of the prebuilt payload, flushed to disk before the rename so a power loss
+    # (common on a handheld) cannot leave a truncated settings file behind.
+    with tmp.open("wb") as handle:
+        handle.write(payload)
+        handle.flush()
+        os.fsync(handle.fileno())
     tmp.replace(path)
+    st = path.stat()
+    _JSON_CACHE[path] = ((st.st_mtime_ns, st.st_size), payload)
 
 
 def _apply_defaults(settings: Dict[str, Any], defaults: Dict[str, Any]) -> bool:
     updated = False
     for key, value in defaults.items():
-        if key not in settings:
+        if key in settings:
+            continue
+        value_type = type(value)
+        if value_type in _IMMUTABLE_DEFAULT_TYPES:
+            settings[key] = value
+        elif value_type in _SHALLOW_COPY_DEFAULT_TYPES and not any(
+            isinstance(item, _SHALLOW_COPY_DEFAULT_TYPES)
+            for item in (value.values() if value_type is dict else value)
+        ):
+            settings[key] = value.copy()
+        else:
+            import copy
+
             settings[key] = copy.deepcopy(value)
-            updated = True
+        updated = True
     return updated
 
 
@@ -25,6 +25,7 @@ APPLICATIONS_DIR = LOCAL_SHARE_DIR / "applications"
 MIME_PACKAGES_DIR = LOCAL_SHARE_DIR / "mime" / "packages"
 BACKUPS_DIR = DATA_DIR / "backups"
 GAME_SAVES_DIR = DATA_DIR / "saves"
+APPIMAGE_MOUNT_PREFIX = ".mount_"
 SAVE_HELPER_STAGED_FILENAME = "save_migration_helper.py"
 BIZHAWK_HELPERS_LIB_DIRNAME = "lib"
 BIZHAWK_HELPERS_APPIMAGE_DIRNAME = "appimage"
@@ -44,6 +45,7 @@ FILE_FILTER_APWORLD = "*.apworld"
 FILE_FILTER_ARCHIVE = "*.zip *.tar.gz"
 FILE_FILTER_EXE = "*.exe"
 FILE_FILTER_ZIP = "*.zip"
+SFC_EXTENSION = ".sfc"
 
 AP_APPIMAGE_KEY = "AP_APPIMAGE"
 AP_DESKTOP_SHORTCUT_KEY = "AP_DESKTOP_SHORTCUT"
@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import contextlib
 import contextvars
+import functools
 import os
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Dict, Iterable, Optional
-from uuid import uuid4
 
 from ap_bizhelper.constants import APP_NAME, LOG_ROOT, USER_AGENT
 
@@ -39,10 +39,14 @@ _CONTEXT_STACK: contextvars.ContextVar[tuple[str, ...]] = contextvars.ContextVar
 )
 _SUPPRESS_CAPTURE = contextvars.ContextVar("ap_bizhelper_suppress_capture", default=False)
 _GLOBAL_LOGGER: Optional[AppLogger] = None
+_SLUG_TABLE = str.maketrans({SPACE: UNDERSCORE, FORWARD_SLASH: DASH})
+_LINE_FMT = "[{ts}] [{eid}] [{loc}] [{lvl}] {msg}\n".format
+_LINE_FMT_CTX = "[{ts}] [{eid}] [{loc}] [{lvl}] [ctx:{ctx}] {msg}\n".format
 
 
+@functools.lru_cache(maxsize=64)
 def _slugify(label: str) -> str:
-    return label.strip().replace(SPACE, UNDERSCORE).replace(FORWARD_SLASH, DASH) or "general"
+    return label.strip().translate(_SLUG_TABLE) or "general"
 
 
 class _StreamCapture:
@@ -103,8 +107,8 @@ class AppLogger:
         run_id: Optional[str] = None,
         timestamp: Optional[str] = None,
     ) -> None:
-        self.timestamp = timestamp or datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        self.run_id = run_id or uuid4().hex[:8]
+        self.timestamp = timestamp or time.strftime("%Y-%m-%d_%H-%M-%S")
+        self.run_id = run_id or os.urandom(4).hex()
         self.category = _slugify(category)
         base_dir = log_dir or LOG_ROOT
         base_dir.mkdir(parents=True, exist_ok=True)
@@ -112,9 +116,9 @@ class AppLogger:
             self.path = Path(log_path)
             self.path.parent.mkdir(parents=True, exist_ok=True)
             stem_parts = self.path.stem.split(UNDERSCORE)
-            if timestamp is None and len(stem_parts) >= 2:
+            if not timestamp and len(stem_parts) >= 2:
                 self.timestamp = stem_parts[-2]
-            if run_id is None and len(stem_parts) >= 1:
+            if not run_id and len(stem_parts) >= 1:
                 self.run_id = stem_parts[-1]
         else:
             self.path = (
@@ -122,6 +126,7 @@ class AppLogger:
                 / f"{self.category}{UNDERSCORE}{self.timestamp}{UNDERSCORE}{self.run_id}{LOG_FILE_SUFFIX}"
             )
         self._sequence = 0
+        self._ts_cache = (-1, "")
         self._original_stdout = _unwrap_stream(sys.stdout)
         self._original_stderr = _unwrap_stream(sys.stderr)
 
@@ -162,29 +167,36 @@ class AppLogger:
         include_context: bool = False,
         mirror_console: bool = False,
         stream: str = STDOUT_STREAM,
+        exc_info: bool = False,
     ) -> str:
+        if exc_info:
+            import traceback
+
+            message = f"{message}{NEWLINE}{traceback.format_exc()}"
         entry_id = self._next_entry_id()
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        sec = int(time.time())
+        # Read and replace the cached (second, text) pair as one tuple so a concurrent log call
+        # never sees a new second paired with the previous second's text.
+        cached_sec, timestamp = self._ts_cache
+        if sec != cached_sec:
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+            self._ts_cache = (sec, timestamp)
         context_label = self._context_label()
         location_id = _slugify(
             location or (context_label.split(CONTEXT_SEPARATOR)[-1] if context_label else DEFAULT_LOCATION)
         )
 
-        parts = [
-            f"{BRACKET_OPEN}{timestamp}{BRACKET_CLOSE}",
-            f"{BRACKET_OPEN}{entry_id}{BRACKET_CLOSE}",
-            f"{BRACKET_OPEN}{location_id}{BRACKET_CLOSE}",
-            f"{BRACKET_OPEN}{level.upper()}{BRACKET_CLOSE}",
-        ]
         if include_context and context_label:
-            parts.append(f"{BRACKET_OPEN}ctx:{context_label}{BRACKET_CLOSE}")
-        parts.append(message)
-        line = SPACE.join(parts)
+            line = _LINE_FMT_CTX(
+                ts=timestamp, eid=entry_id, loc=location_id, lvl=level.upper(), ctx=context_label, msg=message
+            )
+        else:
+            line = _LINE_FMT(ts=timestamp, eid=entry_id, loc=location_id, lvl=level.upper(), msg=message)
         with self.path.open("a", encoding=ENCODING_UTF8) as log_file:
-            log_file.write(line + NEWLINE)
+            log_file.write(line)
 
         if mirror_console:
-            self._write_console(line + NEWLINE, stream=stream)
+            self._write_console(line, stream=stream)
         return entry_id
 
     def log_lines(
@@ -254,13 +266,13 @@ def create_component_logger(
     env_var: Optional[str] = None,
     subdir: Optional[str] = None,
 ) -> AppLogger:
-    env_path = Path(os.environ[env_var]) if env_var and os.environ.get(env_var) else None
+    env_val = os.environ.get(env_var) if env_var else None
     logger = AppLogger(
         category,
         log_dir=LOG_ROOT / subdir if subdir else None,
-        log_path=env_path,
-        run_id=os.environ.get(RUN_ID_ENV) or None,
-        timestamp=os.environ.get(TIMESTAMP_ENV) or None,
+        log_path=Path(env_val) if env_val else None,
+        run_id=os.environ.get(RUN_ID_ENV),
+        timestamp=os.environ.get(TIMESTAMP_ENV),
     )
     logger.capture_console_streams()
     return logger
@@ -272,8 +284,8 @@ def get_app_logger(category: str = DEFAULT_CATEGORY, *, log_dir: Optional[Path]
         _GLOBAL_LOGGER = AppLogger(
             category,
             log_dir=log_dir or LOG_ROOT / "app",
-            run_id=os.environ.get(RUN_ID_ENV) or None,
-            timestamp=os.environ.get(TIMESTAMP_ENV) or None,
+            run_id=os.environ.get(RUN_ID_ENV),
+            timestamp=os.environ.get(TIMESTAMP_ENV),
         )
         _GLOBAL_LOGGER.capture_console_streams()
     return _GLOBAL_LOGGER
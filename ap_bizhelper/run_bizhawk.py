@@ -1,23 +1,23 @@
 #!/usr/bin/env python3
+import functools
+import itertools
 import os
 import shutil
 import subprocess
 import sys
 import time
-import traceback
+from collections import ChainMap
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Mapping, Optional
 
 
 def _prepend_helpers_lib_path() -> None:
-    script_path = Path(__file__).resolve()
-    helpers_root = script_path.parent
-    helpers_lib = helpers_root / "lib"
-    if not helpers_lib.is_dir():
-        return
-    helpers_lib_str = helpers_lib.as_posix()
-    if helpers_lib_str not in sys.path:
-        sys.path.insert(0, helpers_lib_str)
+    # The staged runner is a plain file next to its lib directory, so abspath is enough;
+    # resolving symlinks would only cost extra lstat calls at every start.
+    helpers_lib = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lib")
+    if os.path.isdir(helpers_lib) and helpers_lib not in sys.path:
+        sys.path.insert(0, helpers_lib)
 
 
 _prepend_helpers_lib_path()
@@ -30,6 +30,7 @@ from ap_bizhelper.ap_bizhelper_config import (  # noqa: E402
 from ap_bizhelper.constants import (  # noqa: E402
     AP_BIZHELPER_CONNECTOR_PATH_ENV,
     AP_BIZHELPER_EMUHAWK_PID_ENV,
+    APPIMAGE_MOUNT_PREFIX,
     BIZHAWK_ENTRY_LUA_FILENAME,
     BIZHAWK_EXE_KEY,
     BIZHAWK_HELPERS_ROOT_KEY,
@@ -39,8 +40,8 @@ from ap_bizhelper.constants import (  # noqa: E402
     BIZHAWK_RUNTIME_ROOT_KEY,
     LOG_PREFIX,
     SAVE_MIGRATION_HELPER_PATH_KEY,
+    SFC_EXTENSION,
 )
-from ap_bizhelper.dialogs import fallback_error_dialog  # noqa: E402
 from ap_bizhelper.logging_utils import (  # noqa: E402
     LOG_LEVEL_ERROR,
     LOG_LEVEL_WARNING,
@@ -49,17 +50,17 @@ from ap_bizhelper.logging_utils import (  # noqa: E402
 )
 
 COMMAND_LOCATION = "command"
-CONNECTOR_GENERIC = "connector_bizhawk_generic.lua"
 CONNECTOR_SNI = "Connector.lua"
 CONNECTOR_SNI_FALLBACK = "connector.lua"
 ARCHIPELAGO_ROOT_DIRNAME = "Archipelago"
 ARCHIPELAGO_OPT_DIRNAME = "opt"
 ARCHIPELAGO_SNI_DIRNAME = "SNI"
 ARCHIPELAGO_SNI_LUA_DIRNAME = "lua"
-DEFAULT_MOUNT_PREFIX = ".mount_"
 ENV_CONFIG_LOCATION = "env-config"
 LUA_ARG_PREFIX = "--lua="
+_LUA_ARG_PREFIX_LEN = len(LUA_ARG_PREFIX)
 LUA_EXTENSION = ".lua"
+LUA_FLAG = "--lua"
 NO_AP_FLAG = "--noap"
 OPTION_PREFIX = "-"
 RUNNER_ERROR_TITLE = "BizHawk runner error"
@@ -69,11 +70,38 @@ SETTINGS_LOOKUP_LOCATION = "settings-lookup"
 SETTINGS_SAVE_LOCATION = "settings-save"
 RUNNER_LOGGER = create_component_logger("bizhawk-runner", env_var=RUNNER_LOG_ENV, subdir="runner")
 
-EMUHAWK_PID_DISCOVERY_ATTEMPTS = 12
-EMUHAWK_PID_DISCOVERY_SLEEP_SECONDS = 0.25
+# Variables systemd sets per unit; the runner's values would be stale (or wrong) inside BizHawk's own unit.
+SERVICE_SCOPED_ENV_KEYS = frozenset(
+    {
+        "INVOCATION_ID",
+        "JOURNAL_STREAM",
+        "LISTEN_FDNAMES",
+        "LISTEN_FDS",
+        "LISTEN_PID",
+        "MANAGERPID",
+        "NOTIFY_SOCKET",
+        "SYSTEMD_EXEC_PID",
+        "WATCHDOG_PID",
+        "WATCHDOG_USEC",
+    }
+)
+ARCHIPELAGO_MOUNT_WAIT_SECONDS = 3.0
+ARCHIPELAGO_MOUNT_POLL_SECONDS = 0.25
+EMUHAWK_PID_DISCOVERY_TIMEOUT_SECONDS = 3.0
+EMUHAWK_PID_DISCOVERY_MIN_SLEEP_SECONDS = 0.01
+EMUHAWK_PID_DISCOVERY_MAX_SLEEP_SECONDS = 0.25
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    # The runner exits right after launching BizHawk, so a cached miss can never go stale.
+    return shutil.which(name)
 
 
 def _show_error_dialog(msg: str) -> None:
+    # Imported on demand: the dialog stack is only needed when a launch actually fails.
+    from ap_bizhelper.dialogs import fallback_error_dialog
+
     RUNNER_LOGGER.log(f"Error dialog requested: {msg}", level=LOG_LEVEL_ERROR, include_context=True)
     fallback_error_dialog(msg, title=RUNNER_ERROR_TITLE, logger=RUNNER_LOGGER)
 
@@ -83,10 +111,11 @@ def _load_settings_safe() -> dict[str, Any]:
         return load_settings()
     except Exception as exc:
         RUNNER_LOGGER.log(
-            f"Failed to load settings: {exc}\n{traceback.format_exc()}",
+            f"Failed to load settings: {exc}",
             level=LOG_LEVEL_ERROR,
             include_context=True,
             location=SETTINGS_LOAD_LOCATION,
+            exc_info=True,
         )
         return {}
 
@@ -138,12 +167,8 @@ def get_env_or_config(var: str, settings: dict[str, Any]) -> Optional[str]:
 
 def ensure_bizhawk_exe(settings: dict[str, Any]) -> Path:
     exe = get_env_or_config(BIZHAWK_EXE_KEY, settings)
-    if not exe or not Path(exe).is_file():
-        fallback_error_dialog(
-            f"{LOG_PREFIX} BIZHAWK_EXE is not set or not a file; cannot launch BizHawk.",
-            title=RUNNER_ERROR_TITLE,
-            logger=RUNNER_LOGGER,
-        )
+    if not exe or not os.path.isfile(exe):
+        _show_error_dialog(f"{LOG_PREFIX} BIZHAWK_EXE is not set or not a file; cannot launch BizHawk.")
         sys.exit(1)
     RUNNER_LOGGER.log(f"Resolved BizHawk launcher script: {exe}", include_context=True)
     return Path(exe)
@@ -163,29 +188,41 @@ def _helpers_root(settings: dict[str, Any]) -> Path:
     return Path(os.path.expanduser(value))
 
 
-def _runtime_paths(runtime_root: Path) -> dict[str, Path]:
+@functools.lru_cache(maxsize=4)
+def _runtime_paths(runtime_root: Path) -> dict[str, str]:
+    """Return the runtime files and directories used by validation and env setup."""
+    join = os.path.join
+    bin_dir = join(runtime_root, "usr", "bin")
+    lib_dir = join(runtime_root, "usr", "lib")
+    lib64_dir = join(runtime_root, "usr", "lib64")
+    etc_dir = join(runtime_root, "etc")
     return {
-        "mono": runtime_root / "usr" / "bin" / "mono",
-        "lua": runtime_root / "usr" / "bin" / "lua",
-        "mono_config": runtime_root / "etc" / "mono" / "config",
-        "libgdiplus": runtime_root / "usr" / "lib" / "libgdiplus.so",
-        "libgdiplus_alt": runtime_root / "usr" / "lib" / "libgdiplus.so.0",
-        "libgdiplus64": runtime_root / "usr" / "lib64" / "libgdiplus.so",
-        "libgdiplus64_alt": runtime_root / "usr" / "lib64" / "libgdiplus.so.0",
+        "bin": bin_dir,
+        "lib": lib_dir,
+        "lib64": lib64_dir,
+        "etc": etc_dir,
+        "mono": join(bin_dir, "mono"),
+        "lua": join(bin_dir, "lua"),
+        "mono_config": join(etc_dir, "mono", "config"),
+        "libgdiplus": join(lib_dir, "libgdiplus.so"),
+        "libgdiplus_alt": join(lib_dir, "libgdiplus.so.0"),
+        "libgdiplus64": join(lib64_dir, "libgdiplus.so"),
+        "libgdiplus64_alt": join(lib64_dir, "libgdiplus.so.0"),
     }
 
 
 def _validate_runtime(runtime_root: Path) -> None:
     paths = _runtime_paths(runtime_root)
+    isfile = os.path.isfile
     missing = []
-    if not paths["mono"].is_file():
+    if not isfile(paths["mono"]):
         missing.append("mono")
-    if not paths["lua"].is_file():
+    if not isfile(paths["lua"]):
         missing.append("lua")
-    if not paths["mono_config"].is_file():
+    if not isfile(paths["mono_config"]):
         missing.append("mono config")
     libgdiplus_ok = any(
-        candidate.is_file()
+        isfile(candidate)
         for candidate in (
             paths["libgdiplus"],
             paths["libgdiplus_alt"],
@@ -197,11 +234,9 @@ def _validate_runtime(runtime_root: Path) -> None:
         missing.append("libgdiplus")
 
     if missing:
-        fallback_error_dialog(
+        _show_error_dialog(
             "BizHawk runtime dependencies are missing from runtime_root:\n"
-            f"{runtime_root}\n\nMissing: {', '.join(missing)}",
-            title=RUNNER_ERROR_TITLE,
-            logger=RUNNER_LOGGER,
+            f"{runtime_root}\n\nMissing: {', '.join(missing)}"
         )
         sys.exit(1)
 
@@ -211,7 +246,7 @@ def _parse_lua_arg(ap_lua_arg: str | None) -> Optional[Path]:
         return None
 
     if ap_lua_arg.startswith(LUA_ARG_PREFIX):
-        lua_path = ap_lua_arg[len(LUA_ARG_PREFIX) :]
+        lua_path = ap_lua_arg[_LUA_ARG_PREFIX_LEN:]
     else:
         lua_path = ap_lua_arg
 
@@ -225,35 +260,22 @@ def parse_args(argv):
     emu_args = []
     no_ap = False
 
-    i = 0
-    n = len(argv)
-    while i < n:
-        arg = argv[i]
-        i += 1
-
+    args = iter(argv)
+    for arg in args:
         if arg == NO_AP_FLAG:
             no_ap = True
-            continue
-        if arg.startswith(LUA_ARG_PREFIX):
+        elif arg == LUA_FLAG:
+            value = next(args, None)
+            if value is not None:
+                ap_lua_arg = f"{LUA_ARG_PREFIX}{value}"
+        elif arg.startswith(LUA_ARG_PREFIX):
             ap_lua_arg = arg
-        elif arg == "--lua":
-            if i < n:
-                ap_lua_arg = f"{LUA_ARG_PREFIX}{argv[i]}"
-                i += 1
         else:
             if rom_path is None and not arg.startswith(OPTION_PREFIX):
                 rom_path = arg
             else:
                 emu_args.append(arg)
 
-    # Recovery: if we didn't capture ROM earlier, try first non-option in emu_args
-    if rom_path is None:
-        for idx, a in enumerate(emu_args):
-            if not a.startswith(OPTION_PREFIX):
-                rom_path = a
-                emu_args = emu_args[:idx] + emu_args[idx + 1 :]
-                break
-
     RUNNER_LOGGER.log(
         f"Parsed args rom={rom_path}, ap_lua_arg={ap_lua_arg}, emu_args={emu_args}, no_ap={no_ap}",
         include_context=True,
@@ -262,68 +284,115 @@ def parse_args(argv):
     return rom_path, ap_lua_arg, emu_args, no_ap
 
 
-def _archipelago_mount_candidates() -> list[Path]:
-    mounts = []
-    tmp_dir = Path("/tmp")
-    if not tmp_dir.is_dir():
-        return mounts
-    for entry in tmp_dir.iterdir():
-        if not entry.is_dir():
-            continue
-        if not entry.name.startswith(DEFAULT_MOUNT_PREFIX):
-            continue
-        mounts.append(entry)
-    return mounts
+@dataclass(frozen=True)
+class ArchipelagoLayout:
+    """Candidate Archipelago paths inside one AppImage mount."""
 
+    roots: tuple[Path, ...]
+    sni_connectors: tuple[Path, ...]
+    sni_binaries: tuple[Path, ...]
 
-def _archipelago_root_candidates(mount: Path) -> list[Path]:
-    return [
-        mount / ARCHIPELAGO_OPT_DIRNAME / ARCHIPELAGO_ROOT_DIRNAME,
-        mount / ARCHIPELAGO_ROOT_DIRNAME,
-    ]
 
+def _archipelago_roots(mount_path: str) -> tuple[str, str]:
+    return (
+        os.path.join(mount_path, ARCHIPELAGO_OPT_DIRNAME, ARCHIPELAGO_ROOT_DIRNAME),
+        os.path.join(mount_path, ARCHIPELAGO_ROOT_DIRNAME),
+    )
 
-def _expected_connector_path(mount: Path, connector_name: str) -> list[Path]:
-    return [candidate / connector_name for candidate in _archipelago_root_candidates(mount)]
 
+def _archipelago_layout(mount_path: str) -> ArchipelagoLayout:
+    roots = tuple(Path(root) for root in _archipelago_roots(mount_path))
+    sni_dirs = tuple(root / ARCHIPELAGO_SNI_DIRNAME for root in roots)
+    return ArchipelagoLayout(
+        roots=roots,
+        sni_connectors=tuple(
+            sni_dir / ARCHIPELAGO_SNI_LUA_DIRNAME / name
+            for sni_dir in sni_dirs
+            for name in (CONNECTOR_SNI, CONNECTOR_SNI_FALLBACK)
+        ),
+        sni_binaries=tuple(sni_dir / "sni" for sni_dir in sni_dirs),
+    )
 
-def _expected_sni_path(mount: Path) -> list[Path]:
-    return [
-        candidate / ARCHIPELAGO_SNI_DIRNAME / "sni"
-        for candidate in _archipelago_root_candidates(mount)
-    ]
 
+def _first_file(paths: Iterable[Path]) -> Optional[Path]:
+    for path in paths:
+        if os.path.isfile(path):
+            return path
+    return None
 
-def _expected_sni_connector_paths(mount: Path) -> list[Path]:
-    return [
-        candidate / ARCHIPELAGO_SNI_DIRNAME / ARCHIPELAGO_SNI_LUA_DIRNAME / name
-        for candidate in _archipelago_root_candidates(mount)
-        for name in (CONNECTOR_SNI, CONNECTOR_SNI_FALLBACK)
-    ]
 
+def _mount_mtime(entry: os.DirEntry) -> int:
+    try:
+        return entry.stat(follow_symlinks=False).st_mtime_ns
+    except OSError:
+        return -1
 
-def _find_archipelago_mount() -> Optional[Path]:
-    candidates = _archipelago_mount_candidates()
-    filtered = []
-    for candidate in candidates:
-        name = candidate.name.lower()
-        has_hint = "archip" in name
-        has_connector = any(
-            path.is_file() for path in _expected_connector_path(candidate, CONNECTOR_GENERIC)
-        )
-        has_sni = any(path.is_file() for path in _expected_sni_connector_paths(candidate))
-        has_root = any(path.is_dir() for path in _archipelago_root_candidates(candidate))
-        if has_hint or has_connector or has_sni or has_root:
-            filtered.append(candidate)
 
-    if not filtered:
+def _find_archipelago_mount() -> Optional[ArchipelagoLayout]:
+    """Return the layout of the newest Archipelago AppImage mount under /tmp, in one scan."""
+    matches: list[os.DirEntry] = []
+    try:
+        with os.scandir("/tmp") as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith(APPIMAGE_MOUNT_PREFIX):
+                    continue
+                try:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                except OSError:
+                    continue
+                # A mount named after Archipelago needs no filesystem probes. Otherwise an
+                # existing Archipelago root is enough: every connector file lives under one,
+                # so probing the connectors as well could never admit a mount the root check
+                # rejects.
+                if "archip" in name.lower() or any(
+                    os.path.isdir(root) for root in _archipelago_roots(entry.path)
+                ):
+                    matches.append(entry)
+    except OSError:
         return None
 
-    filtered.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    return filtered[0]
+    if not matches:
+        return None
+    if len(matches) == 1:
+        # The usual case: nothing to break a tie on, so no mtime stat is needed.
+        return _archipelago_layout(matches[0].path)
+    return _archipelago_layout(max(matches, key=_mount_mtime).path)
+
+
+def _layout_ready(layout: Optional[ArchipelagoLayout]) -> bool:
+    # The FUSE mount directory can appear before it is populated.
+    return layout is not None and any(os.path.isdir(root) for root in layout.roots)
 
 
-def _resolve_connector_from_arg(mount: Path, ap_lua_arg: str | None) -> Path:
+def _wait_for_archipelago_mount(timeout: float) -> Optional[ArchipelagoLayout]:
+    """Find the Archipelago mount, rescanning /tmp for up to ``timeout`` seconds until it is ready.
+
+    At the deadline the last mount found is returned even if it never became ready, so callers
+    report its missing files rather than a missing mount.
+    """
+    layout = _find_archipelago_mount()
+    if _layout_ready(layout) or timeout <= 0:
+        return layout
+
+    RUNNER_LOGGER.log(
+        f"Archipelago mount not ready; waiting up to {timeout}s for it to appear.",
+        include_context=True,
+        location="mount-discovery",
+    )
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return layout
+        time.sleep(min(remaining, ARCHIPELAGO_MOUNT_POLL_SECONDS))
+        layout = _find_archipelago_mount() or layout
+        if _layout_ready(layout):
+            return layout
+
+
+def _resolve_connector_from_arg(layout: ArchipelagoLayout, ap_lua_arg: str | None) -> Path:
     lua_path = _parse_lua_arg(ap_lua_arg)
     if not lua_path:
         raise FileNotFoundError(
@@ -337,34 +406,20 @@ def _resolve_connector_from_arg(mount: Path, ap_lua_arg: str | None) -> Path:
     else:
         candidate_paths = [lua_path.with_suffix(LUA_EXTENSION), lua_path]
 
-    candidates: list[Path] = []
     if lua_path.is_absolute():
-        candidates.extend(candidate_paths)
+        candidates: Iterable[Path] = candidate_paths
     else:
-        for candidate_root in _archipelago_root_candidates(mount):
-            for path in candidate_paths:
-                candidates.append(candidate_root / path)
-        for path in candidate_paths:
-            candidates.append(Path.cwd() / path)
-
-    for candidate in candidates:
-        if candidate.is_file():
-            return candidate
-    raise FileNotFoundError(f"Connector not found: {lua_path}")
-
-
-def _resolve_sni_connector(mount: Path) -> Optional[Path]:
-    for candidate in _expected_sni_connector_paths(mount):
-        if candidate.is_file():
-            return candidate
-    return None
-
+        # Lazily built so the probes stop at the first hit; the connector normally sits under
+        # the first Archipelago root, and the cwd is only looked up when the roots miss.
+        candidates = itertools.chain(
+            (root / path for root in layout.roots for path in candidate_paths),
+            (Path.cwd() / path for path in candidate_paths),
+        )
 
-def _resolve_sni(mount: Path) -> Optional[Path]:
-    for candidate in _expected_sni_path(mount):
-        if candidate.is_file():
-            return candidate
-    return None
+    connector = _first_file(candidates)
+    if connector:
+        return connector
+    raise FileNotFoundError(f"Connector not found: {lua_path}")
 
 
 def _resolve_lua_arg_path(ap_lua_arg: str | None) -> Optional[Path]:
@@ -382,56 +437,67 @@ def _resolve_lua_arg_path(ap_lua_arg: str | None) -> Optional[Path]:
     else:
         candidates = [Path.cwd() / candidate for candidate in candidate_paths]
 
-    for candidate in candidates:
-        if candidate.is_file():
-            return candidate
-    return None
+    return _first_file(candidates)
 
 
-def _launch_sni(sni_path: Path, env: dict[str, str]) -> None:
+def _launch_sni(sni_path: Path, env: Mapping[str, str]) -> None:
     RUNNER_LOGGER.log(f"Launching SNI: {sni_path}", include_context=True)
+    # posix_spawn has no cwd option, so switch directories around the spawn; the runner is
+    # single-threaded and restores its own cwd immediately afterwards.
+    previous_cwd = os.getcwd()
     try:
-        subprocess.Popen(
+        os.chdir(sni_path.parent)
+        os.posix_spawn(
+            str(sni_path),
             [str(sni_path)],
-            cwd=str(sni_path.parent),
-            env=env,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
+            env,
+            file_actions=[
+                (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+                (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+            ],
         )
     except Exception as exc:
-        fallback_error_dialog(
-            f"Failed to launch SNI: {exc}",
-            title=RUNNER_ERROR_TITLE,
-            logger=RUNNER_LOGGER,
-        )
+        _show_error_dialog(f"Failed to launch SNI: {exc}")
         sys.exit(1)
+    finally:
+        os.chdir(previous_cwd)
 
 
 def _build_runtime_env(runtime_root: Path, bizhawk_root: Path) -> dict[str, str]:
-    env = os.environ.copy()
-    bin_path = runtime_root / "usr" / "bin"
-    lib_path = runtime_root / "usr" / "lib"
-    lib64_path = runtime_root / "usr" / "lib64"
-
-    env["PATH"] = f"{bin_path}:{env.get('PATH', '')}"
-
-    lib_paths = [str(lib_path)]
-    if lib64_path.is_dir():
-        lib_paths.append(str(lib64_path))
-    if env.get("LD_LIBRARY_PATH"):
-        lib_paths.append(env["LD_LIBRARY_PATH"])
+    """Return the variables BizHawk needs on top of the runner's own environment."""
+    env: dict[str, str] = {}
+    paths = _runtime_paths(runtime_root)
+
+    env["PATH"] = f"{paths['bin']}:{os.environ.get('PATH', '')}"
+
+    # The dynamic linker skips missing directories, so lib64 needs no existence check.
+    lib_paths = [paths["lib"], paths["lib64"]]
+    inherited_lib_path = os.environ.get("LD_LIBRARY_PATH")
+    if inherited_lib_path:
+        lib_paths.append(inherited_lib_path)
     env["LD_LIBRARY_PATH"] = ":".join(lib_paths)
 
-    env["MONO_CFG_DIR"] = str(runtime_root / "etc")
-    env["MONO_CONFIG"] = str(runtime_root / "etc" / "mono" / "config")
+    env["MONO_CFG_DIR"] = paths["etc"]
+    env["MONO_CONFIG"] = paths["mono_config"]
 
-    dll_dir = bizhawk_root / "dll"
-    if dll_dir.is_dir():
-        env["MONO_PATH"] = str(dll_dir)
+    dll_dir = os.path.join(bizhawk_root, "dll")
+    if os.path.isdir(dll_dir):
+        env["MONO_PATH"] = dll_dir
 
     return env
 
 
+def _service_env_opts(env: Mapping[str, str]) -> list[str]:
+    """Return systemd-run ``-E`` options for ``env`` layered over the runner's environment."""
+    return [
+        opt
+        for key, value in ChainMap(env, os.environ).items()
+        if key not in SERVICE_SCOPED_ENV_KEYS
+        for opt in ("-E", f"{key}={value}")
+    ]
+
+
 def _update_state_settings(updates: dict[str, Any]) -> None:
     settings = _load_settings_safe()
     settings.update(updates)
@@ -464,16 +530,59 @@ def _record_pid(pid: int) -> None:
     )
 
 
+def _unit_main_pid(unit: str) -> Optional[int]:
+    """Return the MainPID systemd reports for ``unit``, or None when it is unknown.
+
+    The unit's wrapper shell execs BizHawk's launcher in place, so the unit's main pid is
+    the launcher's pid.
+    """
+    systemctl = _which("systemctl")
+    if not systemctl:
+        return None
+    try:
+        output = subprocess.check_output(
+            [systemctl, "--user", "show", "--property=MainPID", "--value", unit],
+            stdin=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
+            text=True,
+        )
+        pid = int(output.strip() or 0)
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return None
+    return pid or None
+
+
+def _scan_proc_for(needle: bytes) -> Optional[int]:
+    """Return the lowest pid whose command line contains ``needle`` (like ``pgrep -f``)."""
+    own_pid = os.getpid()
+    matches = []
+    with os.scandir("/proc") as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry.name}/cmdline", "rb") as handle:
+                    cmdline = handle.read()
+            except OSError:
+                # The process exited or belongs to another user.
+                continue
+            pid = int(entry.name)
+            if needle in cmdline and pid != own_pid:
+                matches.append(pid)
+    return min(matches) if matches else None
+
+
 def _discover_emuhawk_pid(emuhawk_path: Path) -> Optional[int]:
-    for attempt in range(EMUHAWK_PID_DISCOVERY_ATTEMPTS):
+    needle = os.fsencode(emuhawk_path)
+    deadline = time.monotonic() + EMUHAWK_PID_DISCOVERY_TIMEOUT_SECONDS
+    delay = EMUHAWK_PID_DISCOVERY_MIN_SLEEP_SECONDS
+    attempt = 0
+    while True:
+        attempt += 1
         try:
-            output = subprocess.check_output(
-                ["pgrep", "-f", str(emuhawk_path)],
-                text=True,
-            )
-        except subprocess.CalledProcessError:
-            output = ""
-        except Exception as exc:
+            pid = _scan_proc_for(needle)
+        except OSError as exc:
             RUNNER_LOGGER.log(
                 f"Failed to discover EmuHawk pid: {exc}",
                 level=LOG_LEVEL_WARNING,
@@ -481,18 +590,18 @@ def _discover_emuhawk_pid(emuhawk_path: Path) -> Optional[int]:
                 location="pid-discovery",
             )
             return None
-        for line in output.splitlines():
-            try:
-                return int(line.strip())
-            except ValueError:
-                continue
-        time.sleep(EMUHAWK_PID_DISCOVERY_SLEEP_SECONDS)
-        RUNNER_LOGGER.log(
-            f"Waiting for EmuHawk pid discovery attempt {attempt + 1}/{EMUHAWK_PID_DISCOVERY_ATTEMPTS}.",
-            include_context=True,
-            location="pid-discovery",
-        )
-    return None
+        if pid:
+            return pid
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            RUNNER_LOGGER.log(
+                f"EmuHawk pid not found after {attempt} /proc scans.",
+                include_context=True,
+                location="pid-discovery",
+            )
+            return None
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, EMUHAWK_PID_DISCOVERY_MAX_SLEEP_SECONDS)
 
 
 def main(argv: list[str]) -> int:
@@ -509,19 +618,13 @@ def main(argv: list[str]) -> int:
 
             runtime_root = _runtime_root(settings)
             if not runtime_root:
-                fallback_error_dialog(
-                    f"{LOG_PREFIX} BIZHAWK_RUNTIME_ROOT is not set; cannot launch BizHawk.",
-                    title=RUNNER_ERROR_TITLE,
-                    logger=RUNNER_LOGGER,
-                )
+                _show_error_dialog(f"{LOG_PREFIX} BIZHAWK_RUNTIME_ROOT is not set; cannot launch BizHawk.")
                 return 1
             _validate_runtime(runtime_root)
 
             original_args = list(argv[1:])
             rom_path, ap_lua_arg, emu_args, no_ap = parse_args(original_args)
             needs_archipelago = bool(rom_path or ap_lua_arg) and not no_ap
-            rom_ext = Path(rom_path).suffix.lower().lstrip(".") if rom_path else ""
-            wants_sni = rom_ext == "sfc"
 
             env = _build_runtime_env(runtime_root, bizhawk_root)
             entry_lua: Optional[Path] = None
@@ -554,82 +657,48 @@ def main(argv: list[str]) -> int:
                     )
 
             if needs_archipelago:
-                mount = _find_archipelago_mount()
-                if not mount:
-                    fallback_error_dialog(
+                wants_sni = bool(rom_path) and os.path.splitext(rom_path)[1].lower() == SFC_EXTENSION
+                layout = _wait_for_archipelago_mount(ARCHIPELAGO_MOUNT_WAIT_SECONDS)
+                if not layout:
+                    _show_error_dialog(
                         "Archipelago AppImage mount not found.\n\n"
-                        "Please start Archipelago before launching BizHawk so the AppImage mount is available.",
-                        title=RUNNER_ERROR_TITLE,
-                        logger=RUNNER_LOGGER,
+                        "Please start Archipelago before launching BizHawk so the AppImage mount is available."
                     )
                     return 1
 
                 try:
                     if wants_sni:
-                        connector_path = _resolve_sni_connector(mount)
+                        connector_path = _first_file(layout.sni_connectors)
                         if not connector_path:
-                            fallback_error_dialog(
-                                "SNI connector not found inside Archipelago AppImage mount.",
-                                title=RUNNER_ERROR_TITLE,
-                                logger=RUNNER_LOGGER,
-                            )
+                            _show_error_dialog("SNI connector not found inside Archipelago AppImage mount.")
                             return 1
                     else:
-                        connector_path = _resolve_connector_from_arg(mount, ap_lua_arg)
+                        connector_path = _resolve_connector_from_arg(layout, ap_lua_arg)
                 except FileNotFoundError as exc:
-                    fallback_error_dialog(
-                        str(exc),
-                        title=RUNNER_ERROR_TITLE,
-                        logger=RUNNER_LOGGER,
-                    )
+                    _show_error_dialog(str(exc))
                     return 1
 
                 env[AP_BIZHELPER_CONNECTOR_PATH_ENV] = str(connector_path)
 
                 if wants_sni:
-                    sni_path = _resolve_sni(mount)
+                    sni_path = _first_file(layout.sni_binaries)
                     if not sni_path:
-                        fallback_error_dialog(
-                            "SNI binary not found inside Archipelago AppImage mount.",
-                            title=RUNNER_ERROR_TITLE,
-                            logger=RUNNER_LOGGER,
-                        )
+                        _show_error_dialog("SNI binary not found inside Archipelago AppImage mount.")
                         return 1
-                    _launch_sni(sni_path, env)
+                    _launch_sni(sni_path, ChainMap(env, os.environ))
 
                 helpers_root = _helpers_root(settings)
                 entry_lua = helpers_root / BIZHAWK_ENTRY_LUA_FILENAME
-                if not entry_lua.is_file():
-                    fallback_error_dialog(
-                        f"Missing BizHawk entry Lua script: {entry_lua}",
-                        title=RUNNER_ERROR_TITLE,
-                        logger=RUNNER_LOGGER,
-                    )
+                if not os.path.isfile(entry_lua):
+                    _show_error_dialog(f"Missing BizHawk entry Lua script: {entry_lua}")
                     return 1
 
-            final_args: list[str] = []
-            if rom_path:
-                final_args.append(rom_path)
-            final_args.extend(emu_args)
-            if passthrough_lua_arg:
-                final_args.append(passthrough_lua_arg)
-            if entry_lua:
-                final_args.append(f"--lua={entry_lua}")
-
-            RUNNER_LOGGER.log(
-                f"Launching BizHawk via transient systemd service (Steam-detached): {bizhawk_exe} {final_args}",
-                include_context=True,
-                location=COMMAND_LOCATION,
-            )
-
             _stage_cached_launch(original_args)
 
-            systemd_run = shutil.which("systemd-run")
+            systemd_run = _which("systemd-run")
             if not systemd_run:
-                fallback_error_dialog(
-                    "systemd-run is not available; cannot launch BizHawk as a detached transient service.",
-                    title=RUNNER_ERROR_TITLE,
-                    logger=RUNNER_LOGGER,
+                _show_error_dialog(
+                    "systemd-run is not available; cannot launch BizHawk as a detached transient service."
                 )
                 return 1
 
@@ -641,10 +710,6 @@ def main(argv: list[str]) -> int:
             #
             # Transient services run in a "clean" environment by default, so we explicitly pass the
             # environment we constructed for BizHawk (runtime root, mono config, connector paths, etc.).
-            env_opts: list[str] = []
-            for key, value in sorted(env.items()):
-                env_opts.extend(["-E", f"{key}={value}"])
-
             unit = f"ap-bizhawk-{os.getpid()}-{int(time.time())}"
             cmd = [
                 systemd_run,
@@ -656,52 +721,67 @@ def main(argv: list[str]) -> int:
                 "--working-directory",
                 str(bizhawk_root),
             ]
-            cmd.extend(env_opts)
+            cmd.extend(_service_env_opts(env))
             launch_wrapper = (
                 f"export {AP_BIZHELPER_EMUHAWK_PID_ENV}=$$; exec \"$@\""
             )
-            cmd.extend(
-                [
-                    "--",
-                    "/bin/sh",
-                    "-lc",
-                    launch_wrapper,
-                    "--",
-                    str(bizhawk_exe),
-                    *final_args,
-                ]
+            cmd.extend(["--", "/bin/sh", "-lc", launch_wrapper, "--", str(bizhawk_exe)])
+            args_start = len(cmd)
+            if rom_path:
+                cmd.append(rom_path)
+            cmd.extend(emu_args)
+            if passthrough_lua_arg:
+                cmd.append(passthrough_lua_arg)
+            if entry_lua:
+                cmd.append(f"--lua={entry_lua}")
+
+            RUNNER_LOGGER.log(
+                "Launching BizHawk via transient systemd service (Steam-detached): "
+                f"{bizhawk_exe} {cmd[args_start:]}",
+                include_context=True,
+                location=COMMAND_LOCATION,
             )
 
             # Use the runner's own environment for systemd-run (DBus/session access), while BizHawk gets
-            # the explicit env via -E options above.
+            # the explicit env via -E options above. systemd-run reports its status line and any failure
+            # on stderr, so stdout is discarded and stderr is only decoded when the launch failed.
+            # close_fds=False lets subprocess use posix_spawn; the runner's own descriptors are
+            # non-inheritable (PEP 446), so nothing extra leaks into systemd-run.
             result = subprocess.run(
                 cmd,
-                env=os.environ.copy(),
-                capture_output=True,
-                text=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                close_fds=False,
                 check=False,
             )
 
-            output = f"{result.stdout or ''}\n{result.stderr or ''}".strip()
-            snippet = " ".join(output.split()) or "<no output>"
-            if len(snippet) > 400:
-                snippet = snippet[:400] + "..."
-            RUNNER_LOGGER.log(
-                f"systemd-run service requested (unit={unit}) rc={result.returncode} output={snippet}",
-                include_context=True,
-                location=COMMAND_LOCATION,
-            )
-
-            if result.returncode != 0:
-                fallback_error_dialog(
-                    f"Failed to launch BizHawk via systemd-run service (rc={result.returncode}).\n\nOutput:\n{output}",
-                    title=RUNNER_ERROR_TITLE,
-                    logger=RUNNER_LOGGER,
+            if result.returncode == 0:
+                RUNNER_LOGGER.log(
+                    f"systemd-run service requested (unit={unit}) rc=0",
+                    include_context=True,
+                    location=COMMAND_LOCATION,
+                )
+            else:
+                output = (result.stderr or b"").decode(errors="replace").strip()
+                snippet = " ".join(output.split()) or "<no output>"
+                if len(snippet) > 400:
+                    snippet = snippet[:400] + "..."
+                RUNNER_LOGGER.log(
+                    f"systemd-run service requested (unit={unit}) rc={result.returncode} output={snippet}",
+                    level=LOG_LEVEL_ERROR,
+                    include_context=True,
+                    location=COMMAND_LOCATION,
+                )
+                _show_error_dialog(
+                    f"Failed to launch BizHawk via systemd-run service (rc={result.returncode}).\n\nOutput:\n{output}"
                 )
                 return 1
 
             emuhawk_path = bizhawk_root / "EmuHawkMono.sh"
-            emuhawk_pid = _discover_emuhawk_pid(emuhawk_path)
+            # Type=exec makes systemd-run return only once the unit's process has started, so its
+            # MainPID is normally known already; the /proc scan covers systemctl being unavailable.
+            emuhawk_pid = _unit_main_pid(unit) or _discover_emuhawk_pid(emuhawk_path)
             if emuhawk_pid:
                 RUNNER_LOGGER.log(
                     f"Discovered EmuHawk pid={emuhawk_pid} for {emuhawk_path}.",
@@ -720,10 +800,11 @@ def main(argv: list[str]) -> int:
             return 0
         except Exception as exc:
             RUNNER_LOGGER.log(
-                f"Unhandled exception in BizHawk runner: {exc}\n{traceback.format_exc()}",
+                f"Unhandled exception in BizHawk runner: {exc}",
                 level=LOG_LEVEL_ERROR,
                 include_context=True,
                 location="runner-exception",
+                exc_info=True,
             )
             _show_error_dialog(f"BizHawk runner crashed unexpectedly: {exc}")
             return 1
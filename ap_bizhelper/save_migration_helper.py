@@ -380,11 +380,18 @@ def _migrate_system_dir(system_dir_name: str, *, settings: dict) -> None:
     bizhawk_system_dir.mkdir(parents=True, exist_ok=True)
 
     if save_ram_path.is_symlink():
+        # _ensure_symlink writes the canonical path verbatim, so a single readlink confirms a
+        # valid link; resolve() (a stat per path component) is only needed for other links.
         try:
-            resolved = save_ram_path.resolve()
-        except FileNotFoundError:
-            resolved = None
-        if resolved and resolved == canonical_dir:
+            valid = os.readlink(save_ram_path) == os.fspath(canonical_dir)
+        except OSError:
+            valid = False
+        if not valid:
+            try:
+                valid = save_ram_path.resolve() == canonical_dir
+            except (OSError, RuntimeError):
+                valid = False
+        if valid:
             HELPER_LOGGER.log(
                 f"SaveRAM symlink already valid for {system_dir_name}.",
                 include_context=True,
@@ -0,0 +1,41 @@
+import pytest
+
+from ap_bizhelper import ap_bizhelper_config as config
+
+
+@pytest.fixture(autouse=True)
+def _isolated_config(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(config, "CONFIG_DIR", tmp_path / "config")
+    monkeypatch.setattr(config, "_JSON_CACHE", {})
+
+
+def test_load_json_returns_private_copies(tmp_path) -> None:
+    path = tmp_path / "state.json"
+    config._save_json(path, {"items": []})
+
+    first = config._load_json(path)
+    first["items"].append("mutated")
+
+    assert config._load_json(path) == {"items": []}
+
+
+def test_load_json_sees_external_rewrites(tmp_path) -> None:
+    path = tmp_path / "state.json"
+    config._save_json(path, {"value": 1})
+    assert config._load_json(path) == {"value": 1}
+
+    path.write_text('{"value": 22}\n', encoding="utf-8")
+
+    assert config._load_json(path) == {"value": 22}
+
+
+def test_save_json_skips_unchanged_files(tmp_path) -> None:
+    path = tmp_path / "state.json"
+    config._save_json(path, {"value": 1})
+    inode = path.stat().st_ino
+
+    config._save_json(path, {"value": 1})
+    assert path.stat().st_ino == inode
+
+    config._save_json(path, {"value": 2})
+    assert config._load_json(path) == {"value": 2}
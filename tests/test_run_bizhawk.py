@@ -0,0 +1,105 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from ap_bizhelper import run_bizhawk
+
+
+def test_parse_args_splits_rom_lua_and_options() -> None:
+    rom, lua, emu_args, no_ap = run_bizhawk.parse_args(
+        ["--fullscreen", "game.sfc", "--lua", "connector", "extra", "--noap"]
+    )
+    assert rom == "game.sfc"
+    assert lua == "--lua=connector"
+    assert emu_args == ["--fullscreen", "extra"]
+    assert no_ap is True
+
+
+def test_parse_args_without_rom() -> None:
+    rom, lua, emu_args, no_ap = run_bizhawk.parse_args(["--lua=script.lua", "-x"])
+    assert rom is None
+    assert lua == "--lua=script.lua"
+    assert emu_args == ["-x"]
+    assert no_ap is False
+
+
+def _make_mount(tmp_path, name: str, *, populated: bool, mtime: int = 0):
+    mount = tmp_path / name
+    mount.mkdir()
+    if populated:
+        (mount / "Archipelago").mkdir()
+    if mtime:
+        os.utime(mount, (mtime, mtime))
+    return mount
+
+
+@pytest.fixture
+def fake_tmp(tmp_path, monkeypatch):
+    real_scandir = os.scandir
+
+    def scandir(path="."):
+        return real_scandir(tmp_path if path == "/tmp" else path)
+
+    monkeypatch.setattr(run_bizhawk.os, "scandir", scandir)
+    return tmp_path
+
+
+def test_find_archipelago_mount_prefers_newest_match(fake_tmp) -> None:
+    _make_mount(fake_tmp, ".mount_ArchipelagoOld", populated=True, mtime=1_000)
+    newest = _make_mount(fake_tmp, ".mount_unnamed", populated=True, mtime=3_000)
+    _make_mount(fake_tmp, ".mount_other", populated=False, mtime=5_000)
+    _make_mount(fake_tmp, "Archipelago", populated=True, mtime=6_000)
+
+    layout = run_bizhawk._find_archipelago_mount()
+
+    assert layout is not None
+    assert layout.roots[1] == newest / "Archipelago"
+
+
+def test_wait_returns_hinted_mount_that_never_populates(fake_tmp) -> None:
+    hinted = _make_mount(fake_tmp, ".mount_Archipelago-x", populated=False)
+
+    layout = run_bizhawk._wait_for_archipelago_mount(0.05)
+
+    assert layout is not None
+    assert layout.roots[1] == hinted / "Archipelago"
+    assert not run_bizhawk._layout_ready(layout)
+
+
+def test_main_pid_zero_falls_back_to_proc_scan(tmp_path, monkeypatch) -> None:
+    emuhawk_path = tmp_path / "EmuHawkMono.sh"
+    child = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(30)", str(emuhawk_path)]
+    )
+    try:
+        monkeypatch.setattr(run_bizhawk, "_which", lambda name: "/usr/bin/systemctl")
+        monkeypatch.setattr(run_bizhawk.subprocess, "check_output", lambda *args, **kwargs: "0\n")
+
+        assert run_bizhawk._unit_main_pid("ap-bizhawk-test") is None
+        assert run_bizhawk._discover_emuhawk_pid(emuhawk_path) == child.pid
+    finally:
+        child.kill()
+        child.wait()
+
+
+def test_service_env_opts_skip_service_scoped_keys(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("INVOCATION_ID", "runner-unit")
+    monkeypatch.setenv("NOTIFY_SOCKET", "/run/notify")
+    monkeypatch.setenv("AP_TEST_INHERITED", "inherited")
+    monkeypatch.setenv("PATH", "/usr/bin")
+
+    env = run_bizhawk._build_runtime_env(tmp_path, tmp_path)
+    assert "AP_TEST_INHERITED" not in env
+
+    opts = run_bizhawk._service_env_opts(env)
+    assignments = opts[1::2]
+
+    assert opts[::2] == ["-E"] * len(assignments)
+    assert f"PATH={tmp_path}/usr/bin:/usr/bin" in assignments
+    assert "PATH=/usr/bin" not in assignments
+    assert "AP_TEST_INHERITED=inherited" in assignments
+    assert not any(
+        item.split("=", 1)[0] in run_bizhawk.SERVICE_SCOPED_ENV_KEYS for item in assignments
+    )